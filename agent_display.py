@@ -1,8 +1,17 @@
 import pygame
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
 
+def _blit_batch(target: pygame.Surface, draws: list) -> None:
+    """Blit (surface, position) pairs in one call, preferring pygame-ce's fblits."""
+    if hasattr(target, "fblits"):
+        target.fblits(draws)
+    else:
+        target.blits(draws, doreturn=False)
+
+
 @dataclass
 class SpeechCommand:
     """Describes a speech animation request for the coach bird."""
@@ -38,8 +47,18 @@ class CoachBirdAgent:
         self.speech_end_time: int = 0
         self.last_beak_switch: int = 0
         self.beak_interval_ms: int = 150
+        # Flipped by update() every beak_interval_ms while speaking.
+        self._beak_state: bool = False
         self.display_text: Optional[str] = None
         self.label_font = pygame.font.SysFont("Impact", 18)
+        self.label_color = (240, 234, 161)
+
+        # Status labels never change, so render them once up front. Speech
+        # labels are memoized by text to avoid re-rendering every frame.
+        self._status_ready = self.label_font.render("Ready", True, self.label_color)
+        self._status_thinking = self.label_font.render("Thinking...", True, self.label_color)
+        self._text_cache: OrderedDict[str, pygame.Surface] = OrderedDict()
+        self._text_cache_size: int = 32
         self.dialog_box = PixelDialogBox(
             width=self.panel_rect.width - 32,
             scale_factor=2,
@@ -51,10 +70,47 @@ class CoachBirdAgent:
         self.jump_gravity: float = 900.0
 
         # Panel appearance.
-        self.panel_surface = pygame.Surface((self.panel_rect.width, self.panel_rect.height), pygame.SRCALPHA)
-        self.panel_color = (18, 18, 28, 210)
+        self.panel_color = (18, 18, 28)
+        self.panel_alpha = 210
         self.border_color = (240, 234, 161)
 
+        # The panel is drawn straight onto a subsurface of the target so only
+        # its uniform background needs blending. That uses per-surface alpha
+        # instead of the slower per-pixel alpha path, and the border and
+        # sprites on top stay fully opaque.
+        self.panel_surface: Optional[pygame.Surface] = None
+        self._panel_target: Optional[pygame.Surface] = None
+        self._panel_bg = pygame.Surface(self.panel_rect.size)
+        self._panel_bg.fill(self.panel_color)
+        self._panel_bg.set_alpha(self.panel_alpha)
+
+        # The opaque border is pre-rendered once onto a colorkeyed surface
+        # so it can be blitted along with the rest of the panel contents.
+        border_key = (255, 0, 255)
+        self._panel_border = pygame.Surface(self.panel_rect.size)
+        self._panel_border.fill(border_key)
+        pygame.draw.rect(self._panel_border, self.border_color, self._panel_border.get_rect(), width=2)
+        self._panel_border.set_colorkey(border_key, pygame.RLEACCEL)
+
+        # Layout within the panel. Both bird frames share a size, so every
+        # position except the bounce offset is fixed after construction.
+        self._sprite_x = 20
+        self._bird_w = self.idle_frame.get_width()
+        self._bird_h = self.idle_frame.get_height()
+        self._base_sprite_y = (self.panel_rect.height // 2) - (self._bird_h // 2)
+        self._label_x = self._sprite_x + self._bird_w + 12
+        self._dialog_rect = pygame.Rect(
+            self._sprite_x + self._bird_w + 16,
+            10,
+            self.panel_rect.width - self._sprite_x - self._bird_w - 30,
+            self.panel_rect.height - 20,
+        )
+        self._status_ready_pos = self._status_position(self._status_ready)
+        self._status_thinking_pos = self._status_position(self._status_thinking)
+
+        # Snapshot of what the last draw() showed, see needs_redraw.
+        self._drawn_state: Optional[tuple] = None
+
     def trigger_high_score_bounce(self) -> None:
         """Kick off a short upward bounce to acknowledge a new high score."""
         if self.jump_offset == 0.0:
@@ -66,10 +122,12 @@ class CoachBirdAgent:
         self.speaking = True
         self.speech_end_time = now + int(command.duration * 1000)
         self.last_beak_switch = now
+        self._beak_state = True
         self.display_text = command.text
 
     def stop_speaking(self) -> None:
         self.speaking = False
+        self._beak_state = False
         self.display_text = None
 
     def update(self, delta_time: float) -> None:
@@ -92,46 +150,82 @@ class CoachBirdAgent:
         # Toggle beak while speaking.
         if self.speaking and now - self.last_beak_switch >= self.beak_interval_ms:
             self.last_beak_switch = now
+            self._beak_state = not self._beak_state
 
     def _current_frame(self) -> pygame.Surface:
-        if self.speaking and (pygame.time.get_ticks() // self.beak_interval_ms) % 2 == 0:
-            return self.beak_frame
-        return self.idle_frame
+        return self.beak_frame if (self.speaking and self._beak_state) else self.idle_frame
+
+    def _render_label(self, text: str) -> pygame.Surface:
+        """Return a cached label surface for text, rendering it on a miss."""
+        cached = self._text_cache.get(text)
+        if cached is not None:
+            self._text_cache.move_to_end(text)
+            return cached
+
+        rendered = self.label_font.render(text, True, self.label_color)
+        self._text_cache[text] = rendered
+        if len(self._text_cache) > self._text_cache_size:
+            self._text_cache.popitem(last=False)
+        return rendered
+
+    def _status_position(self, status_surface: pygame.Surface) -> tuple[int, int]:
+        return (
+            self.panel_rect.width - status_surface.get_width() - 14,
+            self.panel_rect.height - status_surface.get_height() - 10,
+        )
 
     def draw(self, surface: pygame.Surface) -> None:
         # Draw panel background.
-        self.panel_surface.fill(self.panel_color)
-        pygame.draw.rect(self.panel_surface, self.border_color, self.panel_surface.get_rect(), width=2)
-
-        # Draw the bird sprite with bounce and a subtle shadow.
-        bird_frame = self._current_frame()
-        sprite_x = 20
-        sprite_y = (self.panel_rect.height // 2) - (bird_frame.get_height() // 2) + int(self.jump_offset)
-        shadow_y = sprite_y + bird_frame.get_height() - 6
-        self.panel_surface.blit(self.shadow, (sprite_x + 2, shadow_y))
-        self.panel_surface.blit(bird_frame, (sprite_x, sprite_y))
+        if self._panel_target is not surface:
+            self.panel_surface = surface.subsurface(self.panel_rect)
+            self._panel_target = surface
+        self.panel_surface.blit(self._panel_bg, (0, 0))
+
+        # Draw the border, then the bird sprite with bounce and a subtle shadow.
+        sprite_y = self._base_sprite_y + int(self.jump_offset)
+        draws = [
+            (self._panel_border, (0, 0)),
+            (self.shadow, (self._sprite_x + 2, sprite_y + self._bird_h - 6)),
+            (self._current_frame(), (self._sprite_x, sprite_y)),
+        ]
+
+        # Skip rendering anything that would land outside the panel's clip.
+        clip = self.panel_surface.get_clip()
 
         # Optional speech label for future TTS/LLM output.
         if self.display_text:
-            text_surface = self.label_font.render(self.display_text, True, (240, 234, 161))
-            self.panel_surface.blit(text_surface, (sprite_x + bird_frame.get_width() + 12, sprite_y + 10))
+            text_surface = self._render_label(self.display_text)
+            text_rect = text_surface.get_rect(topleft=(self._label_x, sprite_y + 10))
+            if clip.colliderect(text_rect):
+                draws.append((text_surface, text_rect.topleft))
 
         # Draw dialog text box with Undertale-inspired pixel edges.
-        if self.dialog_box.is_visible:
-            dialog_rect = pygame.Rect(
-                sprite_x + bird_frame.get_width() + 16,
-                10,
-                self.panel_rect.width - sprite_x - bird_frame.get_width() - 30,
-                self.panel_rect.height - 20,
-            )
-            self.dialog_box.draw(self.panel_surface, dialog_rect)
+        if self.dialog_box.is_visible and clip.colliderect(self._dialog_rect):
+            draws.append((self.dialog_box.render(self._dialog_rect.size), self._dialog_rect.topleft))
 
         # Render active state labels even when no text is provided.
-        status = """Thinking...""" if self.speaking else "Ready"
-        status_surface = self.label_font.render(status, True, (240, 234, 161))
-        self.panel_surface.blit(status_surface, (self.panel_rect.width - status_surface.get_width() - 14, self.panel_rect.height - status_surface.get_height() - 10))
+        if self.speaking:
+            draws.append((self._status_thinking, self._status_thinking_pos))
+        else:
+            draws.append((self._status_ready, self._status_ready_pos))
+
+        _blit_batch(self.panel_surface, draws)
+        self._drawn_state = self._draw_state()
+
+    def _draw_state(self) -> tuple:
+        return (
+            self._current_frame(),
+            int(self.jump_offset),
+            self.display_text,
+            self.speaking,
+            self.dialog_box.is_visible,
+            self.dialog_box.lines,
+        )
 
-        surface.blit(self.panel_surface, self.panel_rect.topleft)
+    @property
+    def needs_redraw(self) -> bool:
+        """Whether draw() would paint something different from last time."""
+        return self._draw_state() != self._drawn_state
 
     @property
     def is_speaking(self) -> bool:
@@ -156,6 +250,15 @@ class PixelDialogBox:
         self.border_color = (240, 234, 161)
         self.visible_until: Optional[int] = None
         self.lines: list[str] = []
+        self.rendered_lines: list[pygame.Surface] = []
+        self._line_cache: OrderedDict[str, pygame.Surface] = OrderedDict()
+        self._line_cache_size: int = 64
+        self._word_width_cache: OrderedDict[str, int] = OrderedDict()
+        self._word_width_cache_size: int = 128
+        self._space_width = self.font.size(" ")[0]
+        self._background: Optional[pygame.Surface] = None
+        self._dialog_surface: Optional[pygame.Surface] = None
+        self._dialog_cache_size: Optional[tuple[int, int]] = None
 
     @property
     def is_visible(self) -> bool:
@@ -163,50 +266,103 @@ class PixelDialogBox:
 
     def show(self, text: str, duration: float) -> None:
         self.lines = self._wrap_text(text)
+        self.rendered_lines = [self._render_text(line) for line in self.lines]
         self.visible_until = pygame.time.get_ticks() + int(duration * 1000)
 
     def update(self, now_ms: int) -> None:
         if self.visible_until is not None and now_ms >= self.visible_until:
             self.visible_until = None
             self.lines = []
+            self.rendered_lines = []
 
     def draw(self, surface: pygame.Surface, target_rect: pygame.Rect) -> None:
-        if not self.is_visible:
+        if not self.is_visible or not surface.get_clip().colliderect(target_rect):
             return
 
-        dialog_surface = pygame.Surface(target_rect.size, pygame.SRCALPHA)
-        dialog_surface.fill(self.box_color)
-        pygame.draw.rect(dialog_surface, self.border_color, dialog_surface.get_rect(), width=2)
+        surface.blit(self.render(target_rect.size), target_rect.topleft)
 
-        y = self.padding
-        for line in self.lines:
-            rendered = self.font.render(line, False, self.text_color)
-            scaled = pygame.transform.scale(
-                rendered,
-                (rendered.get_width() * self.scale_factor, rendered.get_height() * self.scale_factor),
-            )
-            dialog_surface.blit(scaled, (self.padding, y))
-            y += scaled.get_height() + 2
+    def render(self, size: tuple[int, int]) -> pygame.Surface:
+        """Return the dialog box with its wrapped text drawn at the given size."""
+        size = tuple(size)
+        if self._dialog_cache_size != size:
+            self._background = self._render_background(size)
+            self._dialog_surface = pygame.Surface(size, pygame.SRCALPHA)
+            self._dialog_cache_size = size
 
-        surface.blit(dialog_surface, target_rect.topleft)
+        # The background copy overwrites every pixel, so no clear is needed.
+        dialog_surface = self._dialog_surface
+        dialog_surface.blit(self._background, (0, 0))
+
+        y = self.padding
+        for line_surface in self.rendered_lines:
+            dialog_surface.blit(line_surface, (self.padding, y))
+            y += line_surface.get_height() + 2
+
+        return dialog_surface
+
+    def _render_background(self, size: tuple[int, int]) -> pygame.Surface:
+        """Build the filled, bordered box that blits as a straight copy."""
+        background = pygame.Surface(size, pygame.SRCALPHA)
+        background.fill(self.box_color)
+        pygame.draw.rect(background, self.border_color, background.get_rect(), width=2)
+        # Disable blending so blitting this resets the target, alpha included.
+        background.set_alpha(None)
+        return background
+
+    def _render_text(self, line: str) -> pygame.Surface:
+        """Render a single line and upscale it for the chunky pixel look.
+
+        Dialogs repeat a lot of wording between rounds, so finished lines are
+        memoized to rasterize each distinct line only once.
+        """
+        cached = self._line_cache.get(line)
+        if cached is not None:
+            self._line_cache.move_to_end(line)
+            return cached
+
+        rendered = self.font.render(line, False, self.text_color)
+        scaled = pygame.transform.scale(
+            rendered,
+            (rendered.get_width() * self.scale_factor, rendered.get_height() * self.scale_factor),
+        )
+        self._line_cache[line] = scaled
+        if len(self._line_cache) > self._line_cache_size:
+            self._line_cache.popitem(last=False)
+        return scaled
 
     def _wrap_text(self, text: str) -> list[str]:
         words = text.split()
         lines: list[str] = []
         current_line: list[str] = []
+        current_width = 0
 
+        # Track the running line width from cached per-word widths rather
+        # than re-measuring the whole prospective line for every word.
         for word in words:
-            prospective = " ".join(current_line + [word]) if current_line else word
-            width, _ = self.font.size(prospective)
-            width *= self.scale_factor
-            if width <= self.width:
+            word_width = self._word_width(word)
+            width = current_width + self._space_width + word_width if current_line else word_width
+            if width * self.scale_factor <= self.width:
                 current_line.append(word)
+                current_width = width
             else:
                 if current_line:
                     lines.append(" ".join(current_line))
                 current_line = [word]
+                current_width = word_width
 
         if current_line:
             lines.append(" ".join(current_line))
 
         return lines
+
+    def _word_width(self, word: str) -> int:
+        width = self._word_width_cache.get(word)
+        if width is not None:
+            self._word_width_cache.move_to_end(word)
+            return width
+
+        width = self.font.size(word)[0]
+        self._word_width_cache[word] = width
+        if len(self._word_width_cache) > self._word_width_cache_size:
+            self._word_width_cache.popitem(last=False)
+        return width
@@ -29,6 +29,10 @@ hit = 'assets/audio/hit.wav'
 # Initialize pygame mixer for sound playback.
 pygame.mixer.init()
 
+# Decode the effects once up front so playing them never touches the disk.
+WING_SOUND = pygame.mixer.Sound(wing)
+HIT_SOUND = pygame.mixer.Sound(hit)
+
 
 # --- Bird sprite ---
 # Represents the player-controlled bird. Handles animation frames,
@@ -44,27 +48,35 @@ class Bird(pygame.sprite.Sprite):
 
         self.speed = SPEED
 
+        # Build one collision mask per animation frame up front so the
+        # mask always matches the frame on screen without re-rasterizing.
+        self.masks = [pygame.mask.from_surface(image) for image in self.images]
+
         self.current_image = 0
-        self.image = pygame.image.load('assets/sprites/bluebird-upflap.png').convert_alpha()
-        self.mask = pygame.mask.from_surface(self.image)
+        self.image = self.images[0]
+        self.mask = self.masks[0]
 
         # Animation timing: number of milliseconds between animation frames.
         # Increase this value to slow down the wing-flap animation.
         self.animation_time = 120  # ms per frame (change to e.g. 200 for slower)
-        # timestamp of last frame change
-        self.last_anim_time = pygame.time.get_ticks()
+        # timestamp at which the next frame change is due
+        self.next_anim_time = pygame.time.get_ticks() + self.animation_time
 
         self.rect = self.image.get_rect()
         self.rect[0] = SCREEN_WIDHT / 6
         self.rect[1] = SCREEN_HEIGHT / 2
 
-    def update(self):
-        # Time-based animation: only advance the frame when enough ms passed.
+    def animate(self):
+        # Time-based animation: only advance the frame once it is due.
         now = pygame.time.get_ticks()
-        if now - self.last_anim_time >= self.animation_time:
+        if now >= self.next_anim_time:
             self.current_image = (self.current_image + 1) % 3
             self.image = self.images[self.current_image]
-            self.last_anim_time = now
+            self.mask = self.masks[self.current_image]
+            self.next_anim_time = now + self.animation_time
+
+    def update(self):
+        self.animate()
 
         # Apply gravity to vertical speed and update position
         self.speed += GRAVITY
@@ -75,44 +87,40 @@ class Bird(pygame.sprite.Sprite):
 
     def begin(self):
         # Use the same time-based animation while on the start screen
-        now = pygame.time.get_ticks()
-        if now - self.last_anim_time >= self.animation_time:
-            self.current_image = (self.current_image + 1) % 3
-            self.image = self.images[self.current_image]
-            self.last_anim_time = now
+        self.animate()
 
 
 
 
 # --- Pipe sprite ---
 # Represents a single pipe (top or bottom). Can be created inverted (top pipe)
-# and scaled to a fixed width/height; moves left at constant game speed.
+# and scaled to a fixed width/height; scroll_sprites moves it left at constant
+# game speed.
 class Pipe(pygame.sprite.Sprite):
 
     def __init__(self, inverted, xpos, ysize):
         pygame.sprite.Sprite.__init__(self)
+        self.place(inverted, xpos, ysize)
 
-        self. image = pygame.image.load('assets/sprites/pipe-green.png').convert_alpha()
-        self.image = pygame.transform.scale(self.image, (PIPE_WIDHT, PIPE_HEIGHT))
-
+    def place(self, inverted, xpos, ysize):
+        # Share the pre-scaled images and masks loaded at startup instead of
+        # rebuilding them for every new pipe.
+        if inverted:
+            self.image = PIPE_IMAGE_FLIPPED
+            self.mask = PIPE_MASK_FLIPPED
+        else:
+            self.image = PIPE_IMAGE
+            self.mask = PIPE_MASK
 
         self.rect = self.image.get_rect()
         self.rect[0] = xpos
 
         if inverted:
-            self.image = pygame.transform.flip(self.image, False, True)
             self.rect[1] = - (self.rect[3] - ysize)
         else:
             self.rect[1] = SCREEN_HEIGHT - ysize
 
 
-        self.mask = pygame.mask.from_surface(self.image)
-
-
-    def update(self):
-        self.rect[0] -= GAME_SPEED
-
-
 
 # --- Ground sprite ---
 # Large repeating ground image that scrolls left to simulate forward motion.
@@ -120,50 +128,123 @@ class Ground(pygame.sprite.Sprite):
 
     def __init__(self, xpos):
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.image.load('assets/sprites/base.png').convert_alpha()
-        self.image = pygame.transform.scale(self.image, (GROUND_WIDHT, GROUND_HEIGHT))
-
-        self.mask = pygame.mask.from_surface(self.image)
+        self.image = GROUND_IMAGE
+        self.mask = GROUND_MASK
 
         self.rect = self.image.get_rect()
         self.rect[0] = xpos
         self.rect[1] = SCREEN_HEIGHT - GROUND_HEIGHT
-    def update(self):
-        self.rect[0] -= GAME_SPEED
 
 # --- Utility functions ---
 def is_off_screen(sprite):
     # Returns True when a sprite has moved fully off the left side of screen
     return sprite.rect[0] < -(sprite.rect[2])
 
+def scroll_sprites(group, distance):
+    # Shift every sprite in a group left in one flat loop. This is the only
+    # place pipes and ground scroll, so they need no update() of their own.
+    for sprite in group.sprites():
+        sprite.rect[0] -= distance
+
+def collides(sprite, group):
+    # Cheap bounding-box test first; only run the per-pixel mask check
+    # against sprites whose rects actually overlap.
+    for other in group.sprites():
+        if sprite.rect.colliderect(other.rect) and pygame.sprite.collide_mask(sprite, other):
+            return True
+    return False
+
+def erase_rects(rects):
+    # Paint the background back over the screen areas drawn last frame
+    for rect in rects:
+        screen.blit(BACKGROUND, rect, rect)
+
+def draw_group(group, drawn):
+    # Draw a sprite group, recording the screen area each sprite touched
+    sprites = group.sprites()
+    drawn.update(zip(sprites, screen.blits([(sprite.image, sprite.rect) for sprite in sprites])))
+
+def changed_areas(previous, drawn):
+    # Screen areas to push to the display. A sprite's old and new areas are
+    # merged when they overlap, which after a 5px scroll they nearly always
+    # do; areas that are no longer drawn still need their erased background
+    # pushed.
+    previous = dict(previous)
+    areas = []
+    for key, rect in drawn.items():
+        old = previous.pop(key, None)
+        if old and old.colliderect(rect):
+            areas.append(old.union(rect))
+        else:
+            if old:
+                areas.append(old)
+            if rect:
+                areas.append(rect)
+    areas.extend(rect for rect in previous.values() if rect)
+    return areas
+
+def get_pipe(inverted, xpos, ysize):
+    # Reuse a pipe that scrolled away when possible instead of allocating one
+    if pipe_pool:
+        pipe = pipe_pool.pop()
+        pipe.place(inverted, xpos, ysize)
+        return pipe
+    return Pipe(inverted, xpos, ysize)
+
 def get_random_pipes(xpos):
     # Create a pair of pipes (bottom and top) with a randomized gap position
     size = random.randint(100, 300)
-    pipe = Pipe(False, xpos, size)
-    pipe_inverted = Pipe(True, xpos, SCREEN_HEIGHT - size - PIPE_GAP)
+    pipe = get_pipe(False, xpos, size)
+    pipe_inverted = get_pipe(True, xpos, SCREEN_HEIGHT - size - PIPE_GAP)
     return pipe, pipe_inverted
 
+def recycle_ground(group):
+    # Move the ground tile that scrolled away back to the right-hand side.
+    # Re-adding it keeps the leftmost tile first in the group.
+    ground = group.sprites()[0]
+    group.remove(ground)
+    ground.rect[0] = GROUND_WIDHT - 20
+    group.add(ground)
+
 
 # --- Pygame initialization and resource loading ---
 pygame.init()
 pygame.font.init()
 screen = pygame.display.set_mode((SCREEN_WIDHT, SCREEN_HEIGHT))
 pygame.display.set_caption('Flappy Bird')
+# Only quitting, key presses and expose events (which trigger a full
+# repaint) are handled, so keep SDL from queueing mouse motion, other window
+# events etc. that would be drained every frame.
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([QUIT, KEYDOWN, VIDEOEXPOSE, WINDOWEXPOSED])
 score_font = pygame.font.SysFont('Impact', 30)
 score_bg_font = pygame.font.SysFont('Impact', 32)
 
 info_font = pygame.font.SysFont('Impact', 25)
-info_1 = info_font.render("Press 'R' to try again", True, (250, 121, 88))
-info_1_bg = info_font.render("Press 'R' to try again", True, (240, 234, 161))
+info_1 = info_font.render("Press 'R' to try again", True, (250, 121, 88)).convert_alpha()
+info_1_bg = info_font.render("Press 'R' to try again", True, (240, 234, 161)).convert_alpha()
 
 BACKGROUND = pygame.image.load('assets/sprites/background-day.png')
-BACKGROUND = pygame.transform.scale(BACKGROUND, (SCREEN_WIDHT, SCREEN_HEIGHT))
+BACKGROUND = pygame.transform.scale(BACKGROUND, (SCREEN_WIDHT, SCREEN_HEIGHT)).convert()
 BEGIN_IMAGE = pygame.image.load('assets/sprites/message.png').convert_alpha()
 
 # Prepare a Game Over surface to display after the bird dies
 GAME_OVER_TEXT = pygame.image.load('assets/sprites/gameover.png').convert_alpha()
 SCORE_PANEL = pygame.image.load('assets/sprites/score.png').convert_alpha()
 
+# Pipes are respawned constantly, so load/scale/flip the image and build the
+# collision masks once and let every Pipe share them.
+PIPE_IMAGE = pygame.image.load('assets/sprites/pipe-green.png').convert_alpha()
+PIPE_IMAGE = pygame.transform.scale(PIPE_IMAGE, (PIPE_WIDHT, PIPE_HEIGHT))
+PIPE_IMAGE_FLIPPED = pygame.transform.flip(PIPE_IMAGE, False, True)
+PIPE_MASK = pygame.mask.from_surface(PIPE_IMAGE)
+PIPE_MASK_FLIPPED = pygame.mask.from_surface(PIPE_IMAGE_FLIPPED)
+
+# Same for the ground, which is recycled every time a tile scrolls away.
+GROUND_IMAGE = pygame.image.load('assets/sprites/base.png').convert_alpha()
+GROUND_IMAGE = pygame.transform.scale(GROUND_IMAGE, (GROUND_WIDHT, GROUND_HEIGHT))
+GROUND_MASK = pygame.mask.from_surface(GROUND_IMAGE)
+
 # --- Sprite groups and initial objects ---
 bird_group = pygame.sprite.Group()
 bird = Bird()
@@ -177,6 +258,7 @@ for i in range (2):
     ground_group.add(ground)
 
 pipe_group = pygame.sprite.Group()
+pipe_pool = [] # pipes that went off screen, waiting to be reused
 # Create an initial set of pipes positioned off to the right
 for i in range (2):
     pipes = get_random_pipes(SCREEN_WIDHT * i + 800)
@@ -202,6 +284,15 @@ loss_count = 0
 ticks_played = 0 #used to track how much time the player has spend playing. the counter only increment while the bird is alive
 agent_enabled = False
 
+# Dirty-rect bookkeeping: the whole screen is only repainted when switching
+# between the start, playing and game over scenes. Otherwise just the areas
+# drawn last frame are restored and pushed to the display. Resetting
+# drawn_scene forces a full repaint, e.g. after the window was uncovered.
+# dirty_rects maps
+# each sprite (and "panel" for the coach) to the area it covered.
+drawn_scene = None
+dirty_rects = {}
+
 while True:
 
     delta_ms = clock.tick(60)
@@ -212,55 +303,58 @@ while True:
         for event in pygame.event.get():
             if event.type == QUIT:
                 pygame.quit()
+            if event.type in (VIDEOEXPOSE, WINDOWEXPOSED):
+                drawn_scene = None # window contents were lost, repaint everything
             if event.type == KEYDOWN:
                 if event.key == K_SPACE or event.key == K_UP:
                     bird.bump()
-                    pygame.mixer.music.load(wing)
-                    pygame.mixer.music.play()
+                    WING_SOUND.play()
                     begin = False
                     passed = False
                     score = 0
 
 
-
-        screen.blit(BACKGROUND, (0, 0))
-        screen.blit(BEGIN_IMAGE, (120, 150))
+        scene = "begin"
+        full_redraw = scene != drawn_scene
+        if full_redraw:
+            screen.blit(BACKGROUND, (0, 0))
+            screen.blit(BEGIN_IMAGE, (120, 150))
+        else:
+            erase_rects(dirty_rects.values())
 
         if is_off_screen(ground_group.sprites()[0]):
-            ground_group.remove(ground_group.sprites()[0])
-
-            new_ground = Ground(GROUND_WIDHT - 20)
-            ground_group.add(new_ground)
+            recycle_ground(ground_group)
 
         bird.begin()
-        ground_group.update()
+        scroll_sprites(ground_group, GAME_SPEED)
 
-        bird_group.draw(screen)
-        ground_group.draw(screen)
+        drawn = {}
+        draw_group(bird_group, drawn)
+        draw_group(ground_group, drawn)
 
+        # the panel sits over the scrolling ground, so repaint it every frame
         agent_display.update(delta_time)
         agent_display.draw(screen)
-
-        pygame.display.update()
+        drawn["panel"] = agent_display.panel_rect
     #executes after the round has started
     else:
         for event in pygame.event.get():
             if event.type == QUIT:
                 pygame.quit()
+            if event.type in (VIDEOEXPOSE, WINDOWEXPOSED):
+                drawn_scene = None # window contents were lost, repaint everything
             if event.type == KEYDOWN:
                 if alive and (event.key == K_SPACE or event.key == K_UP):
                     bird.bump()
-                    pygame.mixer.music.load(wing)
-                    pygame.mixer.music.play()
+                    WING_SOUND.play()
                 if not alive and not agent_display.is_speaking and event.key == K_r: # reset game
                     alive = 1
                     bird_group.empty()
                     bird = Bird()
                     bird_group.add(bird)
-                    ground_group.empty()
-                    for i in range (2):
-                        ground = Ground(GROUND_WIDHT * i)
-                        ground_group.add(ground)
+                    for i, ground in enumerate(ground_group.sprites()):
+                        ground.rect[0] = GROUND_WIDHT * i
+                    pipe_pool.extend(pipe_group.sprites())
                     pipe_group.empty()
                     # Create an initial set of pipes positioned off to the right
                     for i in range (2):
@@ -270,14 +364,18 @@ while True:
                     begin = True
 
 
-        screen.blit(BACKGROUND, (0, 0))
+        scene = "play" if alive else "over"
+        full_redraw = scene != drawn_scene
+        if full_redraw:
+            screen.blit(BACKGROUND, (0, 0))
+        elif scene == "play":
+            erase_rects(dirty_rects.values())
+        drawn = {}
 
         if (alive):
             if not begin: ticks_played += 1 # count ticks spent playing
             if is_off_screen(ground_group.sprites()[0]):
-                ground_group.remove(ground_group.sprites()[0])
-                new_ground = Ground(GROUND_WIDHT - 20)
-                ground_group.add(new_ground)
+                recycle_ground(ground_group)
 
             # increment score when the bird passes some pipes
             bird_pos = SCREEN_WIDHT / 6
@@ -299,8 +397,9 @@ while True:
                 )
 
             if is_off_screen(pipe_group.sprites()[0]):
-                pipe_group.remove(pipe_group.sprites()[0])
-                pipe_group.remove(pipe_group.sprites()[0])
+                old_pipes = pipe_group.sprites()[:2]
+                pipe_group.remove(old_pipes)
+                pipe_pool.extend(old_pipes)
 
                 pipes = get_random_pipes(SCREEN_WIDHT * 2)
 
@@ -310,23 +409,20 @@ while True:
                 passed = False # used for counting the pipes
 
             bird_group.update()
-            ground_group.update()
-            pipe_group.update()
+            scroll_sprites(ground_group, GAME_SPEED)
+            scroll_sprites(pipe_group, GAME_SPEED)
 
-            bird_group.draw(screen)
-            pipe_group.draw(screen)
-            ground_group.draw(screen)
+            draw_group(bird_group, drawn)
+            draw_group(pipe_group, drawn)
+            draw_group(ground_group, drawn)
 
             agent_display.update(delta_time)
             agent_display.draw(screen)
-
-            pygame.display.update()
+            drawn["panel"] = agent_display.panel_rect
 
             # death event
-            if (pygame.sprite.groupcollide(bird_group, ground_group, False, False, pygame.sprite.collide_mask) or
-                    pygame.sprite.groupcollide(bird_group, pipe_group, False, False, pygame.sprite.collide_mask)):
-                pygame.mixer.music.load(hit)
-                pygame.mixer.music.play()
+            if collides(bird, ground_group) or collides(bird, pipe_group):
+                HIT_SOUND.play()
                 alive = False
                 new_high_score = score > high_score
                 high_score = max(high_score, score)
@@ -341,14 +437,18 @@ while True:
         if not alive:
             # overlay the Game Over text and draw the final frame then
             # player sees the result and can press 'R' to restart.
-            screen.blit(GAME_OVER_TEXT, (100, 100))
-            screen.blit(SCORE_PANEL, (35,200))
-            screen.blit(score_bg_surface, (310,245))
-            screen.blit(score_surface, (310,245))
-            screen.blit(hs_bg_surface, (310,308))
-            screen.blit(hs_surface, (310,308))
-            screen.blit(info_1_bg, (52, 222))
-            screen.blit(info_1, (50, 220))
+            # The overlay is static, so only draw it on the frame the bird
+            # died and when the game over screen is repainted.
+            if full_redraw or scene == "play":
+                screen.blit(GAME_OVER_TEXT, (100, 100))
+                screen.blit(SCORE_PANEL, (35,200))
+                screen.blit(score_bg_surface, (310,245))
+                screen.blit(score_surface, (310,245))
+                screen.blit(hs_bg_surface, (310,308))
+                screen.blit(hs_surface, (310,308))
+                screen.blit(info_1_bg, (52, 222))
+                screen.blit(info_1, (50, 220))
+                full_redraw = True
 
             # check if the conditions for agent to first intervene are met
             if(not agent_enabled and loss_count >= 5 and ticks_played >=1800): # 60 ticks in a second. we check for 30 seconds of gameplay
@@ -359,7 +459,20 @@ while True:
             if(agent_enabled and not agent_display.is_speaking):
                 agent_display.start_speaking(SpeechCommand(duration=2.5, text="Nice run!"))
 
-            agent_display.update(delta_time)
-            agent_display.draw(screen)
-
-            pygame.display.update()
+            # the panel was already drawn this frame if the bird just died.
+            # Nothing else moves on the game over screen, so only repaint the
+            # panel when its contents change.
+            if scene == "over":
+                agent_display.update(delta_time)
+                if full_redraw or agent_display.needs_redraw:
+                    if not full_redraw:
+                        erase_rects([agent_display.panel_rect])
+                    agent_display.draw(screen)
+                    drawn["panel"] = agent_display.panel_rect
+
+    if full_redraw:
+        pygame.display.update()
+    else:
+        pygame.display.update(changed_areas(dirty_rects, drawn))
+    dirty_rects = drawn
+    drawn_scene = scene